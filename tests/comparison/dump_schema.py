@@ -22,10 +22,21 @@ Output Format:
 
 import argparse
 import json
+import re
 import sys
+from dataclasses import dataclass, field
+from itertools import chain
+from operator import itemgetter
 from pathlib import Path
 from typing import Any, Optional
 
+# Heavyweight imports (xmlschema, orjson, msgspec) are deferred into the
+# functions that need them so --help and argparse errors return without
+# paying module-initialization cost.
+
+# Matches "BASE "<path>"" and "URI "<urn>" "<path>"" catalog entries in one pass.
+_CATALOG_ENTRY = re.compile(r'^\s*(BASE|URI)\s+"([^"]+)"(?:\s+"([^"]+)")?', re.MULTILINE)
+
 
 def create_uri_mapper(catalog_path: str):
     """Create a URI mapper function for resolving URNs to local file paths."""
@@ -36,95 +47,194 @@ def create_uri_mapper(catalog_path: str):
     catalog_dir = Path(catalog_path).parent
 
     with open(catalog_path, 'r') as f:
-        for line in f:
-            line = line.strip()
-            if not line or line.startswith('--'):
-                continue
-
-            if line.startswith('BASE'):
-                parts = line.split('"')
-                if len(parts) >= 2:
-                    current_base = parts[1]
-                    # Strip leading ../../ from BASE paths
-                    if current_base.startswith('../../'):
-                        current_base = current_base[6:]
-
-            elif line.startswith('URI'):
-                parts = line.split('"')
-                if len(parts) >= 4:
-                    urn = parts[1]
-                    local_path = parts[3]
-                    if current_base:
-                        full_path = catalog_dir / current_base / local_path
-                    else:
-                        full_path = catalog_dir / local_path
-                    urn_map[urn] = str(full_path.resolve())
+        catalog_text = f.read()
+
+    for match in _CATALOG_ENTRY.finditer(catalog_text):
+        keyword, first, second = match.groups()
+
+        if keyword == 'BASE':
+            current_base = first
+            # Strip leading ../../ from BASE paths
+            if current_base.startswith('../../'):
+                current_base = current_base[6:]
+
+        elif second is not None:
+            if current_base:
+                full_path = catalog_dir / current_base / second
+            else:
+                full_path = catalog_dir / second
+            urn_map[first] = str(full_path.resolve())
+
+    # Key the map by both raw and percent-decoded URNs so resolution is a
+    # single dict lookup with no unquote() on the hot path.
+    resolved_map = {}
+    for urn, local_path in urn_map.items():
+        resolved_map[urn] = local_path
+        resolved_map[unquote(urn)] = local_path
 
     def uri_mapper(uri: str) -> str:
         if uri is None:
             return None
-        decoded_uri = unquote(uri)
-        resolved = urn_map.get(decoded_uri) or urn_map.get(uri)
-        return resolved if resolved else uri
+        hit = resolved_map.get(uri)
+        if hit is not None:
+            return hit
+        # Miss path: a percent-encoded reference may still match a decoded
+        # catalog entry. Misses are rare, so the hot path above stays one get.
+        return resolved_map.get(unquote(uri), uri)
 
     return uri_mapper
 
 
+# xmlschema defines a small fixed set of validator classes, so this cache
+# saturates after the first dozen types; afterwards classification is one
+# dict hit instead of a __name__ access plus substring scans.
+_CATEGORY_CACHE: dict = {}
+
+
+def _category_of(type_obj) -> tuple:
+    """Return (class_name, is_complex, is_simple) for a type object."""
+    cls = type(type_obj)
+    cached = _CATEGORY_CACHE.get(cls)
+    if cached is None:
+        name = cls.__name__
+        cached = (name, 'Complex' in name, 'Simple' in name)
+        _CATEGORY_CACHE[cls] = cached
+    return cached
+
+
+def _intern(s):
+    """Intern qualified-name strings so the thousands of repeats of names
+    like '{http://www.w3.org/2001/XMLSchema}string' in a big dump share one
+    object instead of each holding its own copy."""
+    return sys.intern(s) if type(s) is str else s
+
+
+_ATTR_KEYS = ('name', 'type', 'use', 'default')
+
+
+def _attr_type_str(attr) -> str:
+    """Stringify an attribute's type the way the dump format expects."""
+    a_type = attr.type
+    if a_type is None:
+        return 'xs:string'
+    qn = getattr(a_type, 'qualified_name', None)
+    return _intern(qn) if qn else _intern(str(a_type))
+
+
+def _extract_attrs(type_obj) -> Optional[list]:
+    """Extract the sorted attribute list of a type, or None if it has none."""
+    attributes = getattr(type_obj, 'attributes', None)
+    if not attributes:
+        return None
+
+    # Sort on (name, attr) pairs up front with a C-level key function, then
+    # emit dicts already in order—no lambda dispatch, no second pass. The
+    # records are built from a constant key tuple like the child elements.
+    pairs = [(attr.name or 'unknown', attr) for attr in attributes.values()]
+    pairs.sort(key=itemgetter(0))
+
+    return [dict(zip(_ATTR_KEYS, (
+        name,
+        _attr_type_str(attr),
+        getattr(attr, 'use', None) or 'optional',
+        getattr(attr, 'default', None),
+    ))) for name, attr in pairs]
+
+
+def _name_of(obj) -> str:
+    """Best display name for a component; qualified_name may be a property
+    doing real work, so each accessor is read at most once."""
+    return obj.qualified_name or obj.name or 'unknown'
+
+
+_ELEM_KEYS = ('name', 'type', 'min_occurs', 'max_occurs')
+
+
+def _extract_child_elements(type_obj) -> Optional[list]:
+    """Extract the child elements of a complex type, or None if it has none."""
+    content = getattr(type_obj, 'content', None)
+    iter_elements = getattr(content, 'iter_elements', None) if content else None
+    if iter_elements is None:
+        return None
+
+    # Peek at the iterator before materializing anything: simple-content
+    # complex types commonly yield no elements, and the empty case should
+    # not pay for a list allocation.
+    try:
+        iterator = iter(iter_elements())
+        first = next(iterator, None)
+        if first is None:
+            return None
+
+        children = []
+        for elem in chain((first,), iterator):
+            e_type = elem.type
+            if e_type is not None:
+                qn = getattr(e_type, 'qualified_name', None)
+                type_str = _intern(qn) if qn else type(e_type).__name__
+            else:
+                type_str = 'unknown'
+            # dict(zip(...)) over a constant key tuple builds the record at
+            # C level rather than through a fresh dict-literal each pass.
+            children.append(dict(zip(_ELEM_KEYS, (
+                _name_of(elem),
+                type_str,
+                getattr(elem, 'min_occurs', 1),
+                getattr(elem, 'max_occurs', 1),
+            ))))
+    except (AttributeError, TypeError):
+        return None
+    return children
+
+
+# Memoizes extract_type_info per dump_schema call. Keyed by id() because
+# xmlschema type objects may not be hashable and identity is the right
+# equivalence: shared types (xs:string, reused simple types) are extracted
+# once no matter how many elements reference them. The schema object keeps
+# every type alive for the duration of the dump, so ids are stable.
+_TYPE_INFO_CACHE: dict = {}
+
+
 def extract_type_info(type_obj) -> dict:
     """Extract detailed info about a type."""
+    key = id(type_obj)
+    cached = _TYPE_INFO_CACHE.get(key)
+    if cached is not None:
+        return cached
+
+    qualified_name = _intern(getattr(type_obj, 'qualified_name', None))
+    type_name, is_complex, is_simple = _category_of(type_obj)
     info = {
-        'name': type_obj.qualified_name if hasattr(type_obj, 'qualified_name') else None,
-        'qualified_name': type_obj.qualified_name if hasattr(type_obj, 'qualified_name') else None,
-        'category': type(type_obj).__name__,
-        'is_complex': 'Complex' in type(type_obj).__name__,
-        'is_simple': 'Simple' in type(type_obj).__name__,
+        'name': qualified_name,
+        'qualified_name': qualified_name,
+        'category': type_name,
+        'is_complex': is_complex,
+        'is_simple': is_simple,
     }
 
     # For complex types, get content model
-    if hasattr(type_obj, 'content') and type_obj.content:
-        info['content_model'] = type(type_obj.content).__name__
-
-    # Get attributes
-    if hasattr(type_obj, 'attributes') and type_obj.attributes:
-        info['attributes'] = sorted([
-            {
-                'name': attr.name or 'unknown',
-                'type': (attr.type.qualified_name
-                        if hasattr(attr.type, 'qualified_name') and attr.type.qualified_name
-                        else str(attr.type)) if attr.type else 'xs:string',
-                'use': attr.use if hasattr(attr, 'use') and attr.use else 'optional',
-                'default': attr.default if hasattr(attr, 'default') else None,
-            }
-            for attr in type_obj.attributes.values()
-        ], key=lambda x: x['name'])
+    content = getattr(type_obj, 'content', None)
+    if content:
+        info['content_model'] = type(content).__name__
 
-    # Get elements for complex types
-    if hasattr(type_obj, 'content') and type_obj.content and hasattr(type_obj.content, 'iter_elements'):
-        try:
-            elements = list(type_obj.content.iter_elements())
-            if elements:
-                info['child_elements'] = [
-                    {
-                        'name': elem.qualified_name or elem.name or 'unknown',
-                        'type': (elem.type.qualified_name
-                                if hasattr(elem.type, 'qualified_name') and elem.type.qualified_name
-                                else type(elem.type).__name__) if elem.type else 'unknown',
-                        'min_occurs': elem.min_occurs if hasattr(elem, 'min_occurs') else 1,
-                        'max_occurs': elem.max_occurs if hasattr(elem, 'max_occurs') else 1,
-                    }
-                    for elem in elements
-                ]
-        except Exception:
-            pass
+    attrs = _extract_attrs(type_obj)
+    if attrs is not None:
+        info['attributes'] = attrs
+
+    children = _extract_child_elements(type_obj)
+    if children is not None:
+        info['child_elements'] = children
 
+    _TYPE_INFO_CACHE[key] = info
     return info
 
 
 def extract_element_info(element) -> dict:
     """Extract detailed info about an element."""
+    name = element.qualified_name or element.name
     return {
-        'name': element.qualified_name or element.name,
-        'qualified_name': element.qualified_name or element.name,
+        'name': name,
+        'qualified_name': name,
         'type': extract_type_info(element.type) if element.type else None,
         'min_occurs': element.min_occurs if hasattr(element, 'min_occurs') else 1,
         'max_occurs': element.max_occurs if hasattr(element, 'max_occurs') else 1,
@@ -135,91 +245,67 @@ def extract_element_info(element) -> dict:
 
 def extract_complex_type_info(type_obj) -> dict:
     """Extract info for complex type definition."""
+    name = type_obj.qualified_name or type_obj.name
     info = {
-        'name': type_obj.qualified_name or type_obj.name,
-        'qualified_name': type_obj.qualified_name or type_obj.name,
-        'category': type(type_obj).__name__,
+        'name': name,
+        'qualified_name': name,
+        'category': _category_of(type_obj)[0],
         'is_complex': True,
         'is_simple': False,
     }
 
-    if hasattr(type_obj, 'content') and type_obj.content:
-        info['content_model'] = type(type_obj.content).__name__
-
-    if hasattr(type_obj, 'attributes') and type_obj.attributes:
-        info['attributes'] = sorted([
-            {
-                'name': attr.name or 'unknown',
-                'type': (attr.type.qualified_name
-                        if hasattr(attr.type, 'qualified_name') and attr.type.qualified_name
-                        else str(attr.type)) if attr.type else 'xs:string',
-                'use': attr.use if hasattr(attr, 'use') and attr.use else 'optional',
-                'default': attr.default if hasattr(attr, 'default') else None,
-            }
-            for attr in type_obj.attributes.values()
-        ], key=lambda x: x['name'])
+    content = getattr(type_obj, 'content', None)
+    if content:
+        info['content_model'] = type(content).__name__
 
-    if hasattr(type_obj, 'content') and type_obj.content and hasattr(type_obj.content, 'iter_elements'):
-        try:
-            elements = list(type_obj.content.iter_elements())
-            if elements:
-                info['child_elements'] = [
-                    {
-                        'name': elem.qualified_name or elem.name or 'unknown',
-                        'type': (elem.type.qualified_name
-                                if hasattr(elem.type, 'qualified_name') and elem.type.qualified_name
-                                else type(elem.type).__name__) if elem.type else 'unknown',
-                        'min_occurs': elem.min_occurs if hasattr(elem, 'min_occurs') else 1,
-                        'max_occurs': elem.max_occurs if hasattr(elem, 'max_occurs') else 1,
-                    }
-                    for elem in elements
-                ]
-        except Exception:
-            pass
+    attrs = _extract_attrs(type_obj)
+    if attrs is not None:
+        info['attributes'] = attrs
+
+    children = _extract_child_elements(type_obj)
+    if children is not None:
+        info['child_elements'] = children
 
     return info
 
 
+def _facet_int(v) -> int:
+    """Coerce a length facet (facet object or bare value) to int."""
+    return int(getattr(v, 'value', v))
+
+
+# Maps a facet name to a restriction-dict builder. Handlers return None when
+# the facet value should be skipped; a dict lookup replaces the string
+# if/elif chain that ran for every facet of every simple type.
+_FACET_HANDLERS = {
+    'enumeration': lambda v: {'kind': 'Enumeration', 'values': list(v)} if v else None,
+    'pattern': lambda v: {'kind': 'Pattern', 'value': str(v)} if v else None,
+    'minLength': lambda v: {'kind': 'MinLength', 'value': _facet_int(v)},
+    'maxLength': lambda v: {'kind': 'MaxLength', 'value': _facet_int(v)},
+    'length': lambda v: {'kind': 'Length', 'value': _facet_int(v)},
+}
+
+
 def extract_simple_type_info(type_obj) -> dict:
     """Extract info for simple type definition."""
+    name = type_obj.qualified_name or type_obj.name
     info = {
-        'name': type_obj.qualified_name or type_obj.name,
-        'qualified_name': type_obj.qualified_name or type_obj.name,
-        'category': type(type_obj).__name__,
-        'base_type': type_obj.base_type.qualified_name if hasattr(type_obj, 'base_type') and type_obj.base_type else None,
+        'name': name,
+        'qualified_name': name,
+        'category': _category_of(type_obj)[0],
+        'base_type': _intern(type_obj.base_type.qualified_name) if hasattr(type_obj, 'base_type') and type_obj.base_type else None,
     }
 
     # Extract facets/restrictions
     restrictions = []
-    if hasattr(type_obj, 'facets'):
-        facets = type_obj.facets
-        if facets:
-            for facet_name, facet_value in facets.items():
-                if facet_name == 'enumeration' and facet_value:
-                    restrictions.append({
-                        'kind': 'Enumeration',
-                        'values': list(facet_value)
-                    })
-                elif facet_name == 'pattern' and facet_value:
-                    restrictions.append({
-                        'kind': 'Pattern',
-                        'value': str(facet_value)
-                    })
-                elif facet_name == 'minLength' and facet_value is not None:
-                    restrictions.append({
-                        'kind': 'MinLength',
-                        'value': int(facet_value.value) if hasattr(facet_value, 'value') else int(facet_value)
-                    })
-                elif facet_name == 'maxLength' and facet_value is not None:
-                    restrictions.append({
-                        'kind': 'MaxLength',
-                        'value': int(facet_value.value) if hasattr(facet_value, 'value') else int(facet_value)
-                    })
-                elif facet_name == 'length' and facet_value is not None:
-                    restrictions.append({
-                        'kind': 'Length',
-                        'value': int(facet_value.value) if hasattr(facet_value, 'value') else int(facet_value)
-                    })
+    facets = getattr(type_obj, 'facets', None)
+    if facets:
+        for facet_name, facet_value in facets.items():
+            handler = _FACET_HANDLERS.get(facet_name)
+            if handler is not None and facet_value is not None:
+                restriction = handler(facet_value)
+                if restriction is not None:
+                    restrictions.append(restriction)
 
     if restrictions:
         info['restrictions'] = restrictions
@@ -227,41 +313,305 @@ def extract_simple_type_info(type_obj) -> dict:
     return info
 
 
-def dump_schema(schema_path: str, catalog_path: Optional[str] = None) -> dict:
-    """Load an XSD schema and dump it as a normalized dictionary."""
+def _schema_cache_path(schema_path: str, catalog_path: Optional[str]) -> Path:
+    """Return the pickle cache location for a (schema, catalog) pair."""
+    import hashlib
+    import os
+
+    import xmlschema
+
+    # Key on the xmlschema and Python versions as well as path+mtime, so
+    # pickles from an older library or interpreter are never considered valid.
+    key_parts = [
+        os.path.abspath(schema_path),
+        str(os.path.getmtime(schema_path)),
+        xmlschema.__version__,
+        '%d.%d' % sys.version_info[:2],
+    ]
+    if catalog_path:
+        key_parts.append(os.path.abspath(catalog_path))
+        key_parts.append(str(os.path.getmtime(catalog_path)))
+    key = hashlib.sha1(':'.join(key_parts).encode()).hexdigest()
+    return Path.home() / '.cache' / 'xmlschema-dumper' / f'{key}.pkl'
+
+
+def _schema_sources_manifest(schema) -> list:
+    """Return (path, mtime) for every file-backed source loaded into the maps.
+
+    Covers included/imported modules, not just the entry file, so editing
+    e.g. a types.xsd pulled in via xs:include invalidates the cache even
+    though the entry file's mtime is unchanged.
+    """
+    import os
+    from urllib.parse import urlsplit
+    from urllib.request import url2pathname
+
+    manifest = []
+    for loaded in schema.maps.iter_schemas():
+        url = getattr(loaded, 'url', None)
+        if not url:
+            continue
+        parts = urlsplit(url)
+        if parts.scheme == 'file':
+            path = url2pathname(parts.path)
+        elif not parts.scheme:
+            path = url
+        else:
+            # Remote source: no mtime to validate against.
+            continue
+        try:
+            manifest.append((path, os.path.getmtime(path)))
+        except OSError:
+            manifest.append((path, None))
+    return manifest
+
+
+def _manifest_is_fresh(manifest) -> bool:
+    """True if every source recorded at pickle time still has that mtime."""
+    import os
+
+    for path, mtime in manifest:
+        try:
+            if os.path.getmtime(path) != mtime:
+                return False
+        except OSError:
+            return False
+    return True
+
+
+def _load_schema(schema_path: str, catalog_path: Optional[str], use_cache: bool):
+    """Load an XMLSchema, reusing a pickled copy from previous runs if valid.
+
+    Schema construction dominates runtime on non-trivial schemas and the
+    comparison harness invokes this dumper repeatedly, so the parsed schema
+    is pickled keyed by schema/catalog path and mtime, together with a
+    manifest of every constituent source file; a cache hit is only served
+    when all recorded mtimes still match. Caching is best-effort: anything
+    unpicklable or stale just falls back to a fresh parse.
+    """
+    import pickle
+
+    cache_path = _schema_cache_path(schema_path, catalog_path) if use_cache else None
+    if cache_path is not None and cache_path.exists():
+        try:
+            with open(cache_path, 'rb') as f:
+                payload = pickle.load(f)
+        except (OSError, pickle.PickleError, TypeError, AttributeError,
+                EOFError, ImportError):
+            payload = None
+        if isinstance(payload, dict) and 'schema' in payload \
+                and _manifest_is_fresh(payload.get('manifest', ())):
+            return payload['schema']
+
     import xmlschema
 
-    # Load schema with optional catalog
     if catalog_path:
         uri_mapper = create_uri_mapper(catalog_path)
         schema = xmlschema.XMLSchema(schema_path, uri_mapper=uri_mapper)
     else:
         schema = xmlschema.XMLSchema(schema_path)
 
-    result = {
-        'target_namespace': schema.target_namespace,
-        'schema_location': schema.url if hasattr(schema, 'url') else None,
-        'element_form_default': schema.element_form_default if hasattr(schema, 'element_form_default') else None,
-        'root_elements': [],
-        'complex_types': [],
-        'simple_types': [],
-    }
+    if cache_path is not None:
+        try:
+            payload = {
+                'manifest': _schema_sources_manifest(schema),
+                'schema': schema,
+            }
+            cache_path.parent.mkdir(parents=True, exist_ok=True)
+            with open(cache_path, 'wb') as f:
+                pickle.dump(payload, f, pickle.HIGHEST_PROTOCOL)
+        except (OSError, pickle.PickleError, TypeError, AttributeError):
+            pass
+
+    return schema
+
+
+def _classify_and_extract(type_obj) -> Optional[tuple]:
+    """Return ('complex'|'simple', info_dict) for a named type, or None."""
+    type_name, is_complex, is_simple = _category_of(type_obj)
+    if is_complex:
+        return 'complex', extract_complex_type_info(type_obj)
+    if is_simple or 'Atomic' in type_name or 'List' in type_name or 'Union' in type_name:
+        return 'simple', extract_simple_type_info(type_obj)
+    return None
+
+
+def _extract_types_job(job) -> list:
+    """Worker for parallel extraction: process one chunk of type names.
+
+    Runs in a separate process, so the schema is re-loaded there—cheap when
+    the pickle cache from the parent's parse is warm. Live xmlschema type
+    objects never cross the process boundary, only names and result dicts.
+    """
+    schema_path, catalog_path, names, use_cache = job
+    schema = _load_schema(schema_path, catalog_path, use_cache)
+    results = []
+    for name in names:
+        extracted = _classify_and_extract(schema.types[name])
+        if extracted is not None:
+            results.append(extracted)
+    return results
+
+
+def _extract_named_types_parallel(schema_path: str, catalog_path: Optional[str],
+                                  names: list, jobs: int, use_cache: bool) -> list:
+    """Extract named types across a process pool, preserving input order."""
+    from concurrent.futures import ProcessPoolExecutor
+    from math import ceil
+
+    chunk_size = ceil(len(names) / jobs)
+    chunks = [(schema_path, catalog_path, names[i:i + chunk_size], use_cache)
+              for i in range(0, len(names), chunk_size)]
+
+    results = []
+    with ProcessPoolExecutor(max_workers=jobs) as pool:
+        for chunk_results in pool.map(_extract_types_job, chunks):
+            results.extend(chunk_results)
+    return results
+
+
+@dataclass(slots=True)
+class SchemaDump:
+    """Top-level dump structure; mirrors the Rust SchemaDump struct.
+
+    Slot storage keeps field access array-indexed while the lists are
+    filled; to_dict() shares the list references, so the final conversion
+    for the JSON encoder is six key insertions.
+    """
+    target_namespace: Optional[str] = None
+    schema_location: Optional[str] = None
+    element_form_default: Optional[str] = None
+    root_elements: list = field(default_factory=list)
+    complex_types: list = field(default_factory=list)
+    simple_types: list = field(default_factory=list)
+
+    def to_dict(self) -> dict:
+        return {
+            'target_namespace': self.target_namespace,
+            'schema_location': self.schema_location,
+            'element_form_default': self.element_form_default,
+            'root_elements': self.root_elements,
+            'complex_types': self.complex_types,
+            'simple_types': self.simple_types,
+        }
+
+
+def dump_schema(schema_path: str, catalog_path: Optional[str] = None,
+                use_cache: bool = True, jobs: int = 1) -> dict:
+    """Load an XSD schema and dump it as a normalized dictionary."""
+    _TYPE_INFO_CACHE.clear()
+
+    schema = _load_schema(schema_path, catalog_path, use_cache)
+
+    result = SchemaDump(
+        target_namespace=schema.target_namespace,
+        schema_location=schema.url if hasattr(schema, 'url') else None,
+        element_form_default=schema.element_form_default if hasattr(schema, 'element_form_default') else None,
+    )
 
     # Extract root elements
     if hasattr(schema, 'elements') and schema.elements:
         for name, element in sorted(schema.elements.items()):
-            result['root_elements'].append(extract_element_info(element))
+            result.root_elements.append(extract_element_info(element))
 
-    # Extract named types
+    # Extract named types. Each type's info depends only on that type object,
+    # so with jobs > 1 the sorted name list is chunked across worker
+    # processes; chunks merge back in order, keeping the output identical to
+    # the sequential path.
     if hasattr(schema, 'types') and schema.types:
-        for name, type_obj in sorted(schema.types.items()):
-            type_name = type(type_obj).__name__
-            if 'Complex' in type_name:
-                result['complex_types'].append(extract_complex_type_info(type_obj))
-            elif 'Simple' in type_name or 'Atomic' in type_name or 'List' in type_name or 'Union' in type_name:
-                result['simple_types'].append(extract_simple_type_info(type_obj))
-
-    return result
+        names = sorted(schema.types)
+        if jobs > 1 and len(names) > jobs:
+            extracted = _extract_named_types_parallel(
+                schema_path, catalog_path, names, jobs, use_cache)
+        else:
+            extracted = []
+            for name in names:
+                item = _classify_and_extract(schema.types[name])
+                if item is not None:
+                    extracted.append(item)
+
+        for kind, info in extracted:
+            if kind == 'complex':
+                result.complex_types.append(info)
+            else:
+                result.simple_types.append(info)
+
+    return result.to_dict()
+
+
+def _stream_schema_json(schema, out) -> None:
+    """Stream the dump as compact canonical JSON, one component at a time.
+
+    Writes the same sorted-key document as dump_schema + json.dump but never
+    holds more than a single extracted component dict in memory, so peak
+    memory is O(largest type) instead of O(whole schema). Top-level keys are
+    emitted in sorted order to stay byte-compatible with sort_keys=True.
+    """
+    dumps = json.dumps
+    w = out.write
+
+    types = schema.types if hasattr(schema, 'types') and schema.types else {}
+    names = sorted(types)
+    elements = sorted(schema.elements.items()) \
+        if hasattr(schema, 'elements') and schema.elements else []
+
+    w('{"complex_types": [')
+    first = True
+    for name in names:
+        type_obj = types[name]
+        if _category_of(type_obj)[1]:
+            if not first:
+                w(', ')
+            w(dumps(extract_complex_type_info(type_obj), sort_keys=True))
+            first = False
+
+    w('], "element_form_default": ')
+    w(dumps(schema.element_form_default if hasattr(schema, 'element_form_default') else None))
+
+    w(', "root_elements": [')
+    first = True
+    for _, element in elements:
+        if not first:
+            w(', ')
+        w(dumps(extract_element_info(element), sort_keys=True))
+        first = False
+
+    w('], "schema_location": ')
+    w(dumps(schema.url if hasattr(schema, 'url') else None))
+
+    w(', "simple_types": [')
+    first = True
+    for name in names:
+        type_obj = types[name]
+        type_name, is_complex, is_simple = _category_of(type_obj)
+        if not is_complex and (is_simple or 'Atomic' in type_name
+                               or 'List' in type_name or 'Union' in type_name):
+            if not first:
+                w(', ')
+            w(dumps(extract_simple_type_info(type_obj), sort_keys=True))
+            first = False
+
+    w('], "target_namespace": ')
+    w(dumps(schema.target_namespace))
+    w('}\n')
+
+
+# Sentinel-cached orjson module: _UNRESOLVED until first use, then either the
+# module or None when it is not installed.
+_UNRESOLVED = object()
+_orjson_module = _UNRESOLVED
+
+
+def _get_orjson():
+    """Import orjson on first use, returning None when unavailable."""
+    global _orjson_module
+    if _orjson_module is _UNRESOLVED:
+        try:
+            import orjson
+            _orjson_module = orjson
+        except ImportError:
+            _orjson_module = None
+    return _orjson_module
 
 
 def main():
@@ -272,20 +622,73 @@ def main():
     parser.add_argument('--catalog', '-c', help='Path to XML catalog file')
     parser.add_argument('--output', '-o', help='Output JSON file (default: stdout)')
     parser.add_argument('--pretty', '-p', action='store_true', help='Pretty print JSON')
+    parser.add_argument('--no-cache', action='store_true',
+                        help='Skip the pickled-schema cache and always re-parse')
+    parser.add_argument('--jobs', '-j', type=int, default=1,
+                        help='Worker processes for type extraction (default: 1)')
+    parser.add_argument('--format', '-f', choices=['json', 'msgpack'], default='json',
+                        help='Output format; msgpack (requires msgspec) is a faster '
+                             'binary encoding for CI pipelines (default: json)')
+    parser.add_argument('--stream', action='store_true',
+                        help='Incrementally encode compact JSON for very large '
+                             'schemas (overrides --pretty, json format only)')
 
     args = parser.parse_args()
 
     try:
-        result = dump_schema(args.schema, args.catalog)
-
-        indent = 2 if args.pretty else None
-        json_output = json.dumps(result, indent=indent, sort_keys=True)
-
-        if args.output:
-            with open(args.output, 'w') as f:
-                f.write(json_output)
+        if args.stream and args.format == 'json':
+            _TYPE_INFO_CACHE.clear()
+            schema = _load_schema(args.schema, args.catalog, not args.no_cache)
+            if args.output:
+                with open(args.output, 'w') as f:
+                    _stream_schema_json(schema, f)
+            else:
+                _stream_schema_json(schema, sys.stdout)
+            return
+
+        result = dump_schema(args.schema, args.catalog,
+                             use_cache=not args.no_cache, jobs=args.jobs)
+
+        if args.format == 'msgpack':
+            # Binary opt-in for consumers that want raw speed over the
+            # canonical sorted-JSON comparison format.
+            try:
+                import msgspec
+            except ImportError:
+                print("Error: --format msgpack requires the msgspec package",
+                      file=sys.stderr)
+                sys.exit(1)
+            data = msgspec.msgpack.encode(result)
+            if args.output:
+                with open(args.output, 'wb') as f:
+                    f.write(data)
+            else:
+                sys.stdout.buffer.write(data)
+        elif _get_orjson() is not None:
+            orjson = _get_orjson()
+            # orjson encodes to UTF-8 bytes several times faster than the
+            # stdlib encoder; sorted keys keep the output canonical.
+            option = orjson.OPT_SORT_KEYS
+            if args.pretty:
+                option |= orjson.OPT_INDENT_2
+            data = orjson.dumps(result, option=option)
+            if args.output:
+                with open(args.output, 'wb') as f:
+                    f.write(data)
+            else:
+                sys.stdout.buffer.write(data)
+                sys.stdout.buffer.write(b'\n')
         else:
-            print(json_output)
+            indent = 2 if args.pretty else None
+
+            # json.dump iter-encodes straight to the file handle, avoiding a
+            # second full copy of the dump as an intermediate string.
+            if args.output:
+                with open(args.output, 'w') as f:
+                    json.dump(result, f, indent=indent, sort_keys=True)
+            else:
+                json.dump(result, sys.stdout, indent=indent, sort_keys=True)
+                sys.stdout.write('\n')
 
     except Exception as e:
         print(f"Error: {e}", file=sys.stderr)